@@ -9,33 +9,131 @@ This script automatically signs PDF documents by:
 4. Flattening the PDF to make it non-editable
 """
 
+import argparse
+import logging
 import os
+import shutil
 import sys
-from typing import Dict, Tuple, List, Optional
-import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, Tuple, List, Optional, Set
 from pathlib import Path
 
 try:
     import fitz  # PyMuPDF
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.utils import ImageReader
-    from PIL import Image
 except ImportError as e:
-    print(f"Error: Required packages not installed. Please run: pip install PyMuPDF reportlab Pillow")
+    print("Error: Required packages not installed. Please run: pip install PyMuPDF")
     print(f"Missing package: {e}")
     sys.exit(1)
 
+log = logging.getLogger("pdfsigner")
+
+
+# Default flags used by Page.search_for, needed when building a reusable TextPage
+_SEARCH_FLAGS = (fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE |
+                 fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP)
+
+# Options for the final Document.save: drop and merge duplicate objects, compress all
+# streams, and pack objects and the xref table into compressed object streams (PDF 1.5)
+DEFAULT_SAVE_OPTIONS = {
+    'garbage': 4,
+    'deflate': True,
+    'deflate_images': True,
+    'deflate_fonts': True,
+    'use_objstms': True,
+    'clean': True,
+    'pretty': False,
+}
+
+# Rasterizing fewer pages than this is not worth starting worker processes for
+_PARALLEL_RENDER_MIN_PAGES = 4
+
+# Underscore fill-in lines, tried from longest to shortest
+_UNDERSCORE_NEEDLES = tuple('_' * n for n in (24, 18, 14, 10, 7, 4, 3))
+
+# Text that marks where a signature belongs, in increasing order of preference on a page
+_SIGNATURE_KEYWORDS = ('signature', 'sign here', 'by:', 'signed by', 'name:', 'title:', 'date:')
+
+# Entity keys (lowercase) holding the company name and the address
+_COMPANY_KEYS = frozenset({'company', 'name', 'entity'})
+_ADDRESS_KEYS = frozenset({'address', 'location'})
+
+# Field name fragments that map to the company name
+_COMPANY_FIELD_PATTERNS = (
+    'recipient', 'receiving party', 'offeree', 'representatives', 
+    'representative', 'company', 'name', 'entity', 'party',
+    'organization', 'corporation', 'firm', 'business'
+)
+
+# Field name fragments that map to the address
+_ADDRESS_FIELD_PATTERNS = (
+    'address', 'location', 'street', 'city', 'state', 'zip',
+    'postal', 'residence', 'place'
+)
+
+# Additional field name fragments and the entity keys they map to, in priority order
+_FIELD_MAPPINGS = (
+    ('title', ('title', 'position')),
+    ('date', ('date',)),
+    ('signature', ('company', 'name'))  # For signature fields, use company name
+)
+
 
 class AutoPDFSigner:
     """Main class for handling PDF signing operations."""
     
-    def __init__(self, input_pdf: str, entity_file: str, signature_image: str):
+    def __init__(self, input_pdf: str, entity_file: str, signature_image: str,
+                 save_options: Optional[Dict[str, Any]] = None, rasterize: bool = False,
+                 render_workers: Optional[int] = None, dpi: int = 150,
+                 image_format: str = "png", jpg_quality: int = 85, incremental: bool = False,
+                 subset_fonts: bool = False):
         self.input_pdf = input_pdf
         self.entity_file = entity_file
         self.signature_image = signature_image
+        # Copied, so changing one signer's options never alters the module defaults
+        self.save_options = dict(DEFAULT_SAVE_OPTIONS if save_options is None else save_options)
+        # Flatten by rendering pages to images instead of baking fields into content
+        self.rasterize = rasterize
+        # Worker processes used to render pages when rasterizing
+        self.render_workers = min(os.cpu_count() or 1, 8) if render_workers is None else render_workers
+        # Resolution of the page images when rasterizing
+        if dpi <= 0:
+            raise ValueError(f"dpi must be positive, got {dpi}")
+        self.dpi = dpi
+        # Encoding of the page images when rasterizing: lossless "png" suits text pages,
+        # "jpeg" gives much smaller files for scanned or photo-heavy pages
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(f"image_format must be 'png' or 'jpeg', got {image_format!r}")
+        self.image_format = image_format
+        if not 1 <= jpg_quality <= 100:
+            raise ValueError(f"jpg_quality must be between 1 and 100, got {jpg_quality}")
+        self.jpg_quality = jpg_quality
+        # Append the changes to a copy of the input instead of rewriting the whole file;
+        # not possible when rasterizing, which builds a new document
+        self.incremental = incremental
+        # Reduce embedded fonts to the glyphs the output uses before a full save; off by
+        # default because MuPDF's native subsetter is new and older PyMuPDF needs fontTools
+        self.subset_fonts = subset_fonts
         self.entity_data = {}
         self.pdf_doc = None
+        # Lookup tables derived from entity_data by load_entity_data()
+        self._has_entities = False
+        self._entity_lower: Dict[str, str] = {}
+        self._company_value: Optional[str] = None
+        self._address_value: Optional[str] = None
+        self._mapping_values: Tuple[Tuple[str, Optional[str]], ...] = ()
+        self._match_cache: Dict[str, Optional[str]] = {}
+        # "key: value" lines written next to a fallback signature
+        self._entity_block = ""
+        # Widgets per page number of _widget_cache_doc, so /Annots is only walked once per page
+        self._widget_cache: Dict[int, Tuple[fitz.Page, List[fitz.Widget]]] = {}
+        self._widget_cache_doc: Optional[fitz.Document] = None
+        # Pages the signature or entity text was drawn onto as plain page content;
+        # rasterizing has to cover them even though they have no fields left
+        self._drawn_pages: Set[int] = set()
+        
+        # Read the signature once; it is embedded a single time and reused
+        with open(signature_image, 'rb') as file:
+            self._sig_bytes = file.read()
         
     def load_entity_data(self) -> Dict[str, str]:
         """
@@ -57,45 +155,66 @@ class AutoPDFSigner:
                         key, value = line.split('=', 1)
                         entity_data[key.strip()] = value.strip()
                     else:
-                        print(f"Warning: Invalid format on line {line_num}: {line}")
+                        log.warning("Warning: Invalid format on line %d: %s", line_num, line)
                         
         except FileNotFoundError:
-            print(f"Error: Entity file '{self.entity_file}' not found.")
+            log.error("Error: Entity file '%s' not found.", self.entity_file)
             sys.exit(1)
         except Exception as e:
-            print(f"Error reading entity file: {e}")
+            log.error("Error reading entity file: %s", e)
             sys.exit(1)
             
         self.entity_data = entity_data
+        self._build_entity_index()
         return entity_data
     
-    def create_signature_pdf(self, width: float = 200, height: float = 100) -> str:
+    def _build_entity_index(self) -> None:
+        """Precompute lookups for find_matching_entity_value and the fallback entity text."""
+        entity_lower = {}
+        for key, value in self.entity_data.items():
+            entity_lower.setdefault(key.lower(), value)
+        self._entity_lower = entity_lower
+        self._has_entities = bool(entity_lower)
+        
+        self._company_value = next(
+            (v for k, v in entity_lower.items() if k in _COMPANY_KEYS), None)
+        self._address_value = next(
+            (v for k, v in entity_lower.items() if k in _ADDRESS_KEYS), None)
+        
+        mapping_values = []
+        for pattern, keys in _FIELD_MAPPINGS:
+            value = next(
+                (v for key in keys for k, v in entity_lower.items() if key in k), None)
+            mapping_values.append((pattern, value))
+        self._mapping_values = tuple(mapping_values)
+        self._match_cache = {}
+        self._entity_block = "\n".join(f"{key}: {value}" for key, value in self.entity_data.items())
+    
+    def _iter_widgets(self, pdf_doc: fitz.Document) -> Iterator[Tuple[fitz.Page, fitz.Widget]]:
         """
-        Create a PDF containing the signature image using ReportLab.
+        Iterate over all form widgets in the document, loading each page's widgets once.
         
         Args:
-            width: Width of signature in points
-            height: Height of signature in points
+            pdf_doc: PyMuPDF document object
             
-        Returns:
-            Path to the created signature PDF
+        Yields:
+            (page, widget) tuples in page order
         """
-        signature_pdf_path = "temp_signature.pdf"
+        if pdf_doc is not self._widget_cache_doc:
+            # Cached pages belong to another document
+            self._widget_cache = {}
+            self._widget_cache_doc = pdf_doc
         
-        try:
-            # Create a canvas for the signature
-            c = canvas.Canvas(signature_pdf_path, pagesize=(width, height))
-            
-            # Load and draw the signature image
-            img = ImageReader(self.signature_image)
-            c.drawImage(img, 0, 0, width=width, height=height)
-            c.save()
-            
-            return signature_pdf_path
+        for page_num in range(len(pdf_doc)):
+            if page_num not in self._widget_cache:
+                page = pdf_doc[page_num]
+                # Materialized on purpose: both the text-field and the signature pass
+                # iterate these widgets, and re-walking the generator would re-parse /Annots
+                self._widget_cache[page_num] = (page, list(page.widgets()))
             
-        except Exception as e:
-            print(f"Error creating signature PDF: {e}")
-            return None
+            page, widgets = self._widget_cache[page_num]
+            for widget in widgets:
+                yield page, widget
     
     def fill_form_fields(self, pdf_doc: fitz.Document) -> bool:
         """
@@ -107,29 +226,26 @@ class AutoPDFSigner:
         Returns:
             True if form fields were found and filled, False otherwise
         """
+        if not self._has_entities:
+            return False  # Nothing to fill fields with
+        
         form_filled = False
         
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            
-            # Get form fields (widgets) on this page
-            widgets = list(page.widgets())  # Convert generator to list
+        for page, widget in self._iter_widgets(pdf_doc):
+            field_name = widget.field_name
+            field_type = widget.field_type
             
-            for widget in widgets:
-                field_name = widget.field_name
-                field_type = widget.field_type
-                
-                if field_type == fitz.PDF_WIDGET_TYPE_TEXT:
-                    # Try to match field name with entity data
-                    value = self.find_matching_entity_value(field_name)
-                    if value:
-                        try:
-                            widget.field_value = value
-                            widget.update()
-                            form_filled = True
-                            print(f"Filled field '{field_name}' with '{value}'")
-                        except Exception as e:
-                            print(f"Error filling field '{field_name}': {e}")
+            if field_type == fitz.PDF_WIDGET_TYPE_TEXT:
+                # Try to match field name with entity data
+                value = self.find_matching_entity_value(field_name)
+                if value:
+                    try:
+                        widget.field_value = value
+                        widget.update()
+                        form_filled = True
+                        log.info("Filled field '%s' with '%s'", field_name, value)
+                    except Exception as e:
+                        log.error("Error filling field '%s': %s", field_name, e)
                 
         return form_filled
     
@@ -143,54 +259,45 @@ class AutoPDFSigner:
         Returns:
             Matching value from entity data or None
         """
-        field_name_lower = field_name.lower()
-        
-        # Direct match first
-        for key, value in self.entity_data.items():
-            if key.lower() == field_name_lower:
-                return value
+        if not self._has_entities:
+            return None
         
-        # Enhanced field mappings for company-related fields
-        company_field_patterns = [
-            'recipient', 'receiving party', 'offeree', 'representatives', 
-            'representative', 'company', 'name', 'entity', 'party',
-            'organization', 'corporation', 'firm', 'business'
-        ]
+        # Field names repeat across pages and widget kids, so remember each result
+        if field_name not in self._match_cache:
+            self._match_cache[field_name] = self._lookup_entity_value(field_name.lower())
+        return self._match_cache[field_name]
+    
+    def _lookup_entity_value(self, field_name_lower: str) -> Optional[str]:
+        """
+        Match a lowercase field name against the entity index.
         
-        address_field_patterns = [
-            'address', 'location', 'street', 'city', 'state', 'zip',
-            'postal', 'residence', 'place'
-        ]
+        Args:
+            field_name_lower: Lowercase name of the form field
+            
+        Returns:
+            Matching value from entity data or None
+        """
+        # Direct match first
+        value = self._entity_lower.get(field_name_lower)
+        if value is not None:
+            return value
         
         # Check if field name matches company patterns
-        for pattern in company_field_patterns:
-            if pattern in field_name_lower:
-                # Return company name from entity data
-                for key, value in self.entity_data.items():
-                    if key.lower() in ['company', 'name', 'entity']:
-                        return value
+        if self._company_value is not None:
+            for pattern in _COMPANY_FIELD_PATTERNS:
+                if pattern in field_name_lower:
+                    return self._company_value
         
         # Check if field name matches address patterns
-        for pattern in address_field_patterns:
-            if pattern in field_name_lower:
-                # Return address from entity data
-                for key, value in self.entity_data.items():
-                    if key.lower() in ['address', 'location']:
-                        return value
+        if self._address_value is not None:
+            for pattern in _ADDRESS_FIELD_PATTERNS:
+                if pattern in field_name_lower:
+                    return self._address_value
         
         # Additional specific mappings
-        field_mappings = {
-            'title': ['title', 'position'],
-            'date': ['date'],
-            'signature': ['company', 'name']  # For signature fields, use company name
-        }
-        
-        for pattern, keys in field_mappings.items():
-            if pattern in field_name_lower:
-                for key in keys:
-                    for entity_key, entity_value in self.entity_data.items():
-                        if key.lower() in entity_key.lower():
-                            return entity_value
+        for pattern, value in self._mapping_values:
+            if value is not None and pattern in field_name_lower:
+                return value
         
         return None
     
@@ -205,37 +312,60 @@ class AutoPDFSigner:
             True if signature fields were found and filled, False otherwise
         """
         signature_placed = False
+        sig_xref = 0
         
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            widgets = page.widgets()
-            
-            for widget in widgets:
-                if widget.field_type == fitz.PDF_WIDGET_TYPE_SIGNATURE:
-                    try:
-                        # Get widget rectangle
-                        rect = widget.rect
-                        
-                        # Create signature PDF with appropriate size
-                        sig_width = rect.width
-                        sig_height = rect.height
-                        
-                        signature_pdf_path = self.create_signature_pdf(sig_width, sig_height)
-                        if signature_pdf_path:
-                            # Insert signature as image
-                            page.insert_image(rect, filename=self.signature_image)
-                            signature_placed = True
-                            print(f"Placed signature in signature field on page {page_num + 1}")
+        for page, widget in self._iter_widgets(pdf_doc):
+            if widget.field_type == fitz.PDF_WIDGET_TYPE_SIGNATURE:
+                try:
+                    # Insert signature as image, reusing the embedded image after the first placement
+                    sig_xref = page.insert_image(widget.rect, stream=self._sig_bytes, xref=sig_xref)
+                    self._drawn_pages.add(page.number)
+                    signature_placed = True
+                    log.info("Placed signature in signature field on page %d", page.number + 1)
                             
-                            # Clean up temporary file
-                            if os.path.exists(signature_pdf_path):
-                                os.remove(signature_pdf_path)
-                                
-                    except Exception as e:
-                        print(f"Error placing signature in field: {e}")
+                except Exception as e:
+                    log.error("Error placing signature in field: %s", e)
         
         return signature_placed
     
+    def _find_underscore_line(self, textpage: fitz.TextPage) -> Optional[fitz.Rect]:
+        """
+        Locate the longest underscore fill-in line in a text page.
+        
+        Tries the lengths in _UNDERSCORE_NEEDLES from longest to shortest and returns
+        the first occurrence of the longest one present, like a search for each would.
+        
+        Args:
+            textpage: PyMuPDF text page, usually clipped to a search area
+            
+        Returns:
+            Rectangle of the underscores or None if there are none
+        """
+        # Plain text is cheap to extract; only build per-character boxes if it has a run
+        if _UNDERSCORE_NEEDLES[-1] not in textpage.extractText():
+            return None
+        
+        lines = []
+        for block in textpage.extractRAWDICT()['blocks']:
+            for line in block.get('lines', ()):
+                chars = [char for span in line['spans'] for char in span['chars']]
+                text = ''.join(char['c'] for char in chars)
+                if _UNDERSCORE_NEEDLES[-1] in text:
+                    lines.append((text, chars))
+        
+        for needle in _UNDERSCORE_NEEDLES:
+            for text, chars in lines:
+                start = text.find(needle)
+                if start < 0:
+                    continue
+                
+                underscore_rect = fitz.Rect(chars[start]['bbox'])
+                for char in chars[start + 1:start + len(needle)]:
+                    underscore_rect |= char['bbox']
+                return underscore_rect
+        
+        return None
+    
     def fill_definition_fields(self, pdf_doc: fitz.Document) -> bool:
         """
         Fill definition fields with company name, typically found in definitions sections.
@@ -248,16 +378,11 @@ class AutoPDFSigner:
             True if any definitions were filled, False otherwise
         """
         definitions_filled = False
-        company_name = None
-        
         # Get company name from entity data
-        for key, value in self.entity_data.items():
-            if key.lower() in ['company', 'name', 'entity']:
-                company_name = value
-                break
+        company_name = self._company_value
         
         if not company_name:
-            print("No company name found in entity data for definition filling.")
+            log.info("No company name found in entity data for definition filling.")
             return False
         
         # Definition terms to look for - ONLY "Recipient" to avoid over-filling
@@ -267,99 +392,91 @@ class AutoPDFSigner:
         
         # Track which patterns we've already replaced (once per document)
         replaced_patterns = set()
-        # Track areas where we've already made replacements to avoid overlaps
-        filled_areas = []
+        # Track areas where we've already made replacements to avoid overlaps,
+        # as plain (x0, y0, x1, y1) tuples since they never go to MuPDF
+        filled_areas: List[Tuple[float, float, float, float]] = []
         
-        print(f"Searching for definition fields to fill with '{company_name}'...")
+        log.info("Searching for definition fields to fill with '%s'...", company_name)
         
         # Focus on early pages where definitions are typically found
         max_pages_to_search = min(5, len(pdf_doc))  # Search first 5 pages or all if fewer
         
         for page_num in range(max_pages_to_search):
+            if replaced_patterns.issuperset(definition_terms):
+                break  # Every term has been filled, no need to search further pages
+            
             page = pdf_doc[page_num]
+            # Text extraction for whole-page searches, shared by every search on this page
+            textpage = None
+            # Text inserted on this page, written to its content stream in one go
+            shape = page.new_shape()
+            filled_before = len(replaced_patterns)
             
             # Search for each definition term
             for term in definition_terms:
                 if term in replaced_patterns:
                     continue  # Skip if we've already replaced this term
-                    
-                instances = page.search_for(term, flags=fitz.TEXT_DEHYPHENATE)
+                
+                if textpage is None:
+                    textpage = page.get_textpage(flags=fitz.TEXT_DEHYPHENATE)
+                instances = page.search_for(term, textpage=textpage)
                 
                 if instances:
-                    print(f"Found '{term}' on page {page_num + 1}")
+                    log.debug("Found '%s' on page %d", term, page_num + 1)
                     # Only replace the first instance of each term
                     inst = instances[0]
                     
                     # Check if this area overlaps with a previously filled area
-                    inst_area = fitz.Rect(inst.x0 - 10, inst.y0 - 10, inst.x1 + 10, inst.y1 + 10)
-                    area_overlap = False
-                    for filled_area in filled_areas:
-                        if inst_area.intersects(filled_area):
-                            area_overlap = True
-                            print(f"Skipping '{term}' - overlaps with previously filled area")
-                            break
-                    
-                    if area_overlap:
+                    x0, y0, x1, y1 = inst.x0 - 10, inst.y0 - 10, inst.x1 + 10, inst.y1 + 10
+                    if any(x0 < fx1 and fx0 < x1 and y0 < fy1 and fy0 < y1
+                           for fx0, fy0, fx1, fy1 in filled_areas):
+                        log.debug("Skipping '%s' - overlaps with previously filled area", term)
                         continue  # Skip this instance as it overlaps with previous fill
                     try:
                         # Look for underscores or blank space after the term
                         # Expand search area to the right and down to find fill-in areas
                         search_area = fitz.Rect(inst.x1, inst.y0 - 10, inst.x1 + 500, inst.y1 + 50)
                         
-                        # Look for underscore patterns near the term
-                        underscore_patterns = [
-                            '________________________',  # Very long underscores
-                            '__________________',        # Long underscores  
-                            '______________',            # Medium underscores
-                            '__________',                # Short underscores
-                            '_______',                  # Very short underscores
-                            '____',                     # Minimal underscores
-                            '___'                       # Even shorter
-                        ]
                         replacement_made = False
                         
-                        # First try to find underscores
-                        for underscore_pattern in underscore_patterns:
-                            underscore_instances = page.search_for(underscore_pattern, clip=search_area)
-                            if underscore_instances:
-                                # Use the first (closest) underscore pattern found
-                                underscore_rect = underscore_instances[0]
-                                
-                                # Insert company name directly over the underscores without redaction
-                                # This avoids any risk of blanking out text above or below
-                                text_x = underscore_rect.x0
-                                text_y = underscore_rect.y1 - 2  # Slightly above the bottom for proper baseline
+                        # First try to find underscores, extracting the search area text only once
+                        search_area_textpage = page.get_textpage(clip=search_area, flags=_SEARCH_FLAGS)
+                        underscore_rect = self._find_underscore_line(search_area_textpage)
+                        if underscore_rect is not None:
+                            # Insert company name directly over the underscores without redaction
+                            # This avoids any risk of blanking out text above or below
+                            text_x = underscore_rect.x0
+                            text_y = underscore_rect.y1 - 2  # Slightly above the bottom for proper baseline
                                 
-                                page.insert_text(
-                                    fitz.Point(text_x, text_y),
-                                    company_name,
-                                    fontsize=10,
-                                    color=(0, 0, 0)
-                                )
+                            shape.insert_text(
+                                fitz.Point(text_x, text_y),
+                                company_name,
+                                fontsize=10,
+                                color=(0, 0, 0)
+                            )
                                 
-                                replaced_patterns.add(term)
-                                replacement_made = True
-                                definitions_filled = True
-                                print(f"✅ Filled definition '{term}' (underscores) with '{company_name}' on page {page_num + 1}")
-                                break
+                            replaced_patterns.add(term)
+                            replacement_made = True
+                            definitions_filled = True
+                            log.info("✅ Filled definition '%s' (underscores) with '%s' on page %d", term, company_name, page_num + 1)
                         
                         # If no underscores found, try other patterns
                         if not replacement_made:
                             # Check for "term means" pattern
                             means_pattern = f"{term} means"
-                            means_instances = page.search_for(means_pattern, flags=fitz.TEXT_DEHYPHENATE)
+                            means_instances = page.search_for(means_pattern, textpage=textpage)
                             if means_instances:
                                 means_rect = means_instances[0]
                                 # Insert company name after "means"
                                 insert_point = fitz.Point(means_rect.x1 + 5, means_rect.y1)
-                                page.insert_text(
+                                shape.insert_text(
                                     insert_point,
                                     f" {company_name}",
                                     fontsize=10,
                                     color=(0, 0, 0)
                                 )
                                 definitions_filled = True
-                                print(f"✅ Filled definition '{term}' (means) with '{company_name}' on page {page_num + 1}")
+                                log.info("✅ Filled definition '%s' (means) with '%s' on page %d", term, company_name, page_num + 1)
                                 replacement_made = True
                                 # Mark this term as completed to prevent any future fills
                                 replaced_patterns.add(term)
@@ -367,19 +484,19 @@ class AutoPDFSigner:
                             # Check for "term:" pattern
                             elif not replacement_made:
                                 colon_pattern = f"{term}:"
-                                colon_instances = page.search_for(colon_pattern, flags=fitz.TEXT_DEHYPHENATE)
+                                colon_instances = page.search_for(colon_pattern, textpage=textpage)
                                 if colon_instances:
                                     colon_rect = colon_instances[0]
                                     # Insert company name after colon
                                     insert_point = fitz.Point(colon_rect.x1 + 5, colon_rect.y1)
-                                    page.insert_text(
+                                    shape.insert_text(
                                         insert_point,
                                         f" {company_name}",
                                         fontsize=10,
                                         color=(0, 0, 0)
                                     )
                                     definitions_filled = True
-                                    print(f"✅ Filled definition '{term}' (colon) with '{company_name}' on page {page_num + 1}")
+                                    log.info("✅ Filled definition '%s' (colon) with '%s' on page %d", term, company_name, page_num + 1)
                                     replacement_made = True
                                     # Mark this term as completed to prevent any future fills
                                     replaced_patterns.add(term)
@@ -391,14 +508,15 @@ class AutoPDFSigner:
                             # Expand search area to cover more possibilities
                             bracket_search = fitz.Rect(inst.x0 - 50, inst.y0 - 30, inst.x1 + 700, inst.y1 + 60)
                             
-                            print(f"Searching for brackets near '{term}' in area: {bracket_search}")
+                            log.debug("Searching for brackets near '%s' in area: %s", term, bracket_search)
+                            bracket_textpage = page.get_textpage(clip=bracket_search, flags=_SEARCH_FLAGS)
                             
                             # Look specifically for square brackets first, as they're most likely for fill-ins
                             # Search for square brackets pattern [________________] 
-                            square_bracket_instances = page.search_for("[", clip=bracket_search)
+                            square_bracket_instances = page.search_for("[", textpage=bracket_textpage)
                             
                             if square_bracket_instances:
-                                print(f"Found {len(square_bracket_instances)} '[' bracket(s) near '{term}'")
+                                log.debug("Found %d '[' bracket(s) near '%s'", len(square_bracket_instances), term)
                                 
                                 # Look for the square bracket that's AFTER the term (fill-in area)
                                 term_x_end = inst.x1
@@ -413,15 +531,12 @@ class AutoPDFSigner:
                                     
                                     if closing_bracket_instances:
                                         closing_bracket_rect = closing_bracket_instances[0]
-                                        print(f"Found square bracket fill area for '{term}': [ at [{bracket_rect.x0:.1f},{bracket_rect.y0:.1f}] to ] at [{closing_bracket_rect.x0:.1f},{closing_bracket_rect.y0:.1f}]")
+                                        log.debug("Found square bracket fill area for '%s': [ at [%.1f,%.1f] to ] at [%.1f,%.1f]", term, bracket_rect.x0, bracket_rect.y0, closing_bracket_rect.x0, closing_bracket_rect.y0)
                                         
                                         # Calculate the center of the area between brackets
                                         fill_area_center_x = (bracket_rect.x1 + closing_bracket_rect.x0) / 2
                                         fill_area_y = bracket_rect.y1 - 3  # Slightly above the baseline
                                         
-                                        # Clear any underscores in the bracket area first
-                                        bracket_fill_area = fitz.Rect(bracket_rect.x1 + 1, bracket_rect.y0 - 5, closing_bracket_rect.x0 - 1, bracket_rect.y1 + 5)
-                                        
                                         # Skip underscore removal to avoid text blanking
                                         # Just insert text directly without clearing underscores
                                         
@@ -429,7 +544,7 @@ class AutoPDFSigner:
                                         # Adjust x position to center the text better
                                         text_width_estimate = len(company_name) * 5  # Estimate text width
                                         insert_point = fitz.Point(fill_area_center_x - text_width_estimate/2, fill_area_y)
-                                        page.insert_text(
+                                        shape.insert_text(
                                             insert_point,
                                             company_name,
                                             fontsize=10,
@@ -437,54 +552,51 @@ class AutoPDFSigner:
                                         )
                                         
                                         definitions_filled = True
-                                        print(f"✅ Filled definition '{term}' (square brackets) with '{company_name}' on page {page_num + 1}")
+                                        log.info("✅ Filled definition '%s' (square brackets) with '%s' on page %d", term, company_name, page_num + 1)
                                         replacement_made = True
                                         # Track this area as filled to prevent overlaps
-                                        filled_areas.append(fitz.Rect(bracket_rect.x0 - 20, bracket_rect.y0 - 10, closing_bracket_rect.x1 + 20, closing_bracket_rect.y1 + 10))
+                                        filled_areas.append((bracket_rect.x0 - 20, bracket_rect.y0 - 10, closing_bracket_rect.x1 + 20, closing_bracket_rect.y1 + 10))
                                         # Mark this term as completed to prevent any future fills
                                         replaced_patterns.add(term)
                                         break
                                     else:
-                                        print(f"Found opening [ for '{term}' but no closing ]")
+                                        log.debug("Found opening [ for '%s' but no closing ]", term)
                                 else:
-                                    print(f"Found [ brackets but none are after the '{term}' text")
+                                    log.debug("Found [ brackets but none are after the '%s' text", term)
                             else:
-                                print(f"No square brackets found near '{term}'")
+                                log.debug("No square brackets found near '%s'", term)
                             
                             if not replacement_made:
-                                print(f"No bracket pairs found near '{term}', checking for other fill patterns...")
+                                log.debug("No bracket pairs found near '%s', checking for other fill patterns...", term)
                                 
                                 # Look for lines/underscores without brackets  
                                 line_found = False
-                                for underscore_pattern in underscore_patterns:
-                                    underscore_instances = page.search_for(underscore_pattern, clip=bracket_search)
-                                    if underscore_instances:
-                                        print(f"Found underscore pattern '{underscore_pattern}' near '{term}'")
-                                        underscore_rect = underscore_instances[0]
+                                underscore_rect = self._find_underscore_line(bracket_textpage)
+                                if underscore_rect is not None:
+                                    log.debug("Found underscore line near '%s'", term)
                                         
-                                        # Insert company name directly over the underscore area without redaction
-                                        center_x = (underscore_rect.x0 + underscore_rect.x1) / 2
-                                        text_width_estimate = len(company_name) * 5
-                                        insert_point = fitz.Point(center_x - text_width_estimate/2, underscore_rect.y1 - 2)
-                                        page.insert_text(
-                                            insert_point,
-                                            company_name,
-                                            fontsize=10,
-                                            color=(0, 0, 0)
-                                        )
+                                    # Insert company name directly over the underscore area without redaction
+                                    center_x = (underscore_rect.x0 + underscore_rect.x1) / 2
+                                    text_width_estimate = len(company_name) * 5
+                                    insert_point = fitz.Point(center_x - text_width_estimate/2, underscore_rect.y1 - 2)
+                                    shape.insert_text(
+                                        insert_point,
+                                        company_name,
+                                        fontsize=10,
+                                        color=(0, 0, 0)
+                                    )
                                         
-                                        definitions_filled = True
-                                        print(f"✅ Filled definition '{term}' (underscore line) with '{company_name}' on page {page_num + 1}")
-                                        replacement_made = True
-                                        line_found = True
-                                        # Track this area as filled to prevent overlaps
-                                        filled_areas.append(fitz.Rect(underscore_rect.x0 - 20, underscore_rect.y0 - 10, underscore_rect.x1 + 20, underscore_rect.y1 + 10))
-                                        # Mark this term as completed to prevent any future fills
-                                        replaced_patterns.add(term)
-                                        break
+                                    definitions_filled = True
+                                    log.info("✅ Filled definition '%s' (underscore line) with '%s' on page %d", term, company_name, page_num + 1)
+                                    replacement_made = True
+                                    line_found = True
+                                    # Track this area as filled to prevent overlaps
+                                    filled_areas.append((underscore_rect.x0 - 20, underscore_rect.y0 - 10, underscore_rect.x1 + 20, underscore_rect.y1 + 10))
+                                    # Mark this term as completed to prevent any future fills
+                                    replaced_patterns.add(term)
                                 
                                 if not line_found:
-                                    print(f"No fill-in patterns found near '{term}'")
+                                    log.debug("No fill-in patterns found near '%s'", term)
                             
                             # If no square brackets, try parentheses
                             if not replacement_made:
@@ -496,46 +608,50 @@ class AutoPDFSigner:
                                     # Insert company name after opening parenthesis
                                     paren_rect = paren_instances[0]
                                     insert_point = fitz.Point(paren_rect.x1 + 2, paren_rect.y1)
-                                    page.insert_text(
+                                    shape.insert_text(
                                         insert_point,
                                         f'"{company_name}"',
                                         fontsize=10,
                                         color=(0, 0, 0)
                                     )
                                     definitions_filled = True
-                                    print(f"✅ Filled definition '{term}' (parentheses) with '{company_name}' on page {page_num + 1}")
+                                    log.info("✅ Filled definition '%s' (parentheses) with '%s' on page %d", term, company_name, page_num + 1)
                                     replacement_made = True
                                     # Track this area as filled to prevent overlaps
-                                    filled_areas.append(fitz.Rect(paren_rect.x0 - 20, paren_rect.y0 - 10, paren_rect.x0 + 200, paren_rect.y1 + 10))
+                                    filled_areas.append((paren_rect.x0 - 20, paren_rect.y0 - 10, paren_rect.x0 + 200, paren_rect.y1 + 10))
                                     # Mark this term as completed to prevent any future fills
                                     replaced_patterns.add(term)
                                     # Also mark related terms to prevent substring matches
                                     if term == 'Representatives':
                                         replaced_patterns.add('Representative')
-                                        print(f"Also marked 'Representative' as completed to prevent duplicates")
+                                        log.debug("Also marked 'Representative' as completed to prevent duplicates")
                                 else:
                                     # Last resort: place text directly after the term with some spacing
                                     insert_point = fitz.Point(inst.x1 + 10, inst.y1)
-                                    page.insert_text(
+                                    shape.insert_text(
                                         insert_point,
                                         f' ("{company_name}")',
                                         fontsize=10,
                                         color=(0, 0, 0)
                                     )
                                     definitions_filled = True
-                                    print(f"✅ Filled definition '{term}' (direct placement) with '{company_name}' on page {page_num + 1}")
+                                    log.info("✅ Filled definition '%s' (direct placement) with '%s' on page %d", term, company_name, page_num + 1)
                                     # Track this area as filled to prevent overlaps
-                                    filled_areas.append(fitz.Rect(inst.x0 - 20, inst.y0 - 10, inst.x1 + 200, inst.y1 + 10))
+                                    filled_areas.append((inst.x0 - 20, inst.y0 - 10, inst.x1 + 200, inst.y1 + 10))
                                     # Mark this term as completed to prevent any future fills
                                     replaced_patterns.add(term)
                         
                     except Exception as e:
-                        print(f"❌ Error filling definition '{term}' on page {page_num + 1}: {e}")
+                        log.error("❌ Error filling definition '%s' on page %d: %s", term, page_num + 1, e)
+            
+            shape.commit()
+            if len(replaced_patterns) > filled_before:
+                self._drawn_pages.add(page_num)
         
         if definitions_filled:
-            print(f"Completed filling definitions. Replaced {len(replaced_patterns)} definition(s).")
+            log.info("Completed filling definitions. Replaced %d definition(s).", len(replaced_patterns))
         else:
-            print("No definition fields found to fill.")
+            log.info("No definition fields found to fill.")
             
         return definitions_filled
 
@@ -546,7 +662,7 @@ class AutoPDFSigner:
         Args:
             pdf_doc: PyMuPDF document object
         """
-        print("No form fields found. Using fallback placement...")
+        log.info("No form fields found. Using fallback placement...")
         
         # First, try to fill definition fields
         definitions_filled = self.fill_definition_fields(pdf_doc)
@@ -555,23 +671,27 @@ class AutoPDFSigner:
         last_page = pdf_doc[-1]
         page_rect = last_page.rect
         
-        # Search for signature-related keywords on all pages
-        signature_keywords = ['signature', 'sign here', 'by:', 'signed by', 'name:', 'title:', 'date:']
-        signature_locations = []
+        # Search for the last signature-related keyword in the document: walk pages
+        # from the end, extracting each page's text once, and stop at the first match
+        signature_location = None
         
-        for page_num in range(len(pdf_doc)):
+        for page_num in range(len(pdf_doc) - 1, -1, -1):
             page = pdf_doc[page_num]
+            textpage = page.get_textpage(flags=fitz.TEXT_DEHYPHENATE)
+            
+            for keyword in reversed(_SIGNATURE_KEYWORDS):
+                instances = page.search_for(keyword, textpage=textpage)
+                if instances:
+                    signature_location = (page, instances[-1])
+                    break
             
-            for keyword in signature_keywords:
-                instances = page.search_for(keyword, flags=fitz.TEXT_DEHYPHENATE)
-                for inst in instances:
-                    signature_locations.append((page_num, inst, keyword))
+            if signature_location:
+                break
         
         # Determine signature placement
-        if signature_locations:
+        if signature_location:
             # Use the last found signature location
-            page_num, rect, keyword = signature_locations[-1]
-            target_page = pdf_doc[page_num]
+            target_page, rect = signature_location
             
             # Place signature below the found keyword
             sig_rect = fitz.Rect(rect.x0, rect.y1 + 10, rect.x0 + 150, rect.y1 + 60)
@@ -582,10 +702,11 @@ class AutoPDFSigner:
         
         # Insert signature image
         try:
-            target_page.insert_image(sig_rect, filename=self.signature_image)
-            print(f"Placed signature on page {target_page.number + 1}")
+            target_page.insert_image(sig_rect, stream=self._sig_bytes)
+            self._drawn_pages.add(target_page.number)
+            log.info("Placed signature on page %d", target_page.number + 1)
         except Exception as e:
-            print(f"Error placing signature: {e}")
+            log.error("Error placing signature: %s", e)
         
         # Add entity data as text
         self.add_entity_text(target_page, sig_rect)
@@ -599,63 +720,160 @@ class AutoPDFSigner:
             sig_rect: Rectangle where signature was placed
         """
         try:
-            y_position = sig_rect.y1 + 20
-            
-            for key, value in self.entity_data.items():
-                text = f"{key}: {value}"
-                text_rect = fitz.Rect(sig_rect.x0, y_position, sig_rect.x0 + 300, y_position + 15)
-                
-                page.insert_text(
-                    text_rect.tl,
-                    text,
-                    fontsize=10,
-                    color=(0, 0, 0)
-                )
-                
-                y_position += 20
+            # One multi-line text object; lineheight 2 keeps the 20pt spacing at fontsize 10
+            shape = page.new_shape()
+            shape.insert_text(
+                fitz.Point(sig_rect.x0, sig_rect.y1 + 20),
+                self._entity_block,
+                fontsize=10,
+                lineheight=2,
+                color=(0, 0, 0)
+            )
+            shape.commit()
+            self._drawn_pages.add(page.number)
                 
         except Exception as e:
-            print(f"Error adding entity text: {e}")
+            log.error("Error adding entity text: %s", e)
     
     def flatten_pdf(self, pdf_doc: fitz.Document) -> None:
         """
         Flatten the PDF to make form fields non-editable.
         
+        Form fields and annotations are baked into the page content, keeping text
+        and vector graphics intact. If the signer was created with rasterize=True,
+        pages with fields, annotations or signer-drawn content are instead replaced
+        by images of themselves.
+        
         Args:
             pdf_doc: PyMuPDF document object
         """
         try:
-            # Create a new document for flattened content
-            flattened_doc = fitz.open()
-            
-            # Convert each page to an image and back to PDF (flattening)
-            for page_num in range(len(pdf_doc)):
-                page = pdf_doc[page_num]
-                
-                # Get page as pixmap with good resolution
-                mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for quality
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Create new page in flattened document
-                new_page = flattened_doc.new_page(width=page.rect.width, height=page.rect.height)
+            if self.rasterize:
+                self._rasterize_pdf(pdf_doc)
+            else:
+                self._bake_pdf(pdf_doc)
                 
-                # Insert the pixmap as image
-                new_page.insert_image(page.rect, pixmap=pix)
-                
-            # Replace original document content
-            pdf_doc.close()
+            log.info("PDF flattened successfully")
+            
+        except Exception as e:
+            log.error("Error flattening PDF: %s", e)
+        finally:
+            # Baking or rasterizing invalidates the cached widgets, even if it failed halfway
+            self._widget_cache = {}
+            self._widget_cache_doc = None
+    
+    def _bake_pdf(self, pdf_doc: fitz.Document) -> None:
+        """
+        Convert form fields and annotations into permanent page content in place.
+        
+        Args:
+            pdf_doc: PyMuPDF document object
+        """
+        if hasattr(pdf_doc, 'bake'):
+            pdf_doc.bake(annots=True, widgets=True)
+            return
+        
+        # Older PyMuPDF without Document.bake: at least lock every field
+        for page in pdf_doc:
+            for widget in page.widgets():
+                widget.field_flags |= fitz.PDF_FIELD_IS_READ_ONLY
+                widget.update()
+    
+    def _rasterize_pdf(self, pdf_doc: fitz.Document) -> None:
+        """
+        Replace every interactive page with an image of itself, closing the original document.
+        
+        Only pages carrying form fields or annotations, or that the signer drew the
+        signature or entity text onto, are rasterized; the rest have nothing to
+        flatten and are copied over unchanged.
+        
+        Args:
+            pdf_doc: PyMuPDF document object
+        """
+        # Create a new document for flattened content
+        flattened_doc = fitz.open()
+        page_count = len(pdf_doc)
+        zoom = self.dpi / 72.0  # Render at the target resolution, no supersampling
+        
+        raster_pages = [page_num for page_num in range(page_count)
+                        if page_num in self._drawn_pages
+                        or pdf_doc[page_num].first_widget is not None
+                        or pdf_doc[page_num].first_annot is not None]
+        
+        # Render pages in worker processes when there are enough of them
+        workers = min(self.render_workers, len(raster_pages))
+        page_images = None
+        if workers > 1 and len(raster_pages) >= _PARALLEL_RENDER_MIN_PAGES:
+            try:
+                page_images = self._render_pages_parallel(pdf_doc, raster_pages, zoom, workers)
+            except Exception as e:
+                log.warning("Parallel rendering failed, rendering pages one by one: %s", e)
+        
+        raster_set = set(raster_pages)
+        last_static = max((n for n in range(page_count) if n not in raster_set), default=-1)
+        
+        # Convert each interactive page to an image and back to PDF (flattening)
+        page_num = 0
+        while page_num < page_count:
+            if page_num not in raster_set:
+                # Static pages: copy each run of them in one call instead of rendering it.
+                # final=False keeps the graft map between calls, so fonts and images the
+                # runs share are copied once rather than once per run
+                run_end = page_num
+                while run_end + 1 < page_count and run_end + 1 not in raster_set:
+                    run_end += 1
+                flattened_doc.insert_pdf(pdf_doc, from_page=page_num, to_page=run_end,
+                                         final=run_end == last_static)
+                page_num = run_end + 1
+                continue
             
-            # Re-open the document and replace with flattened content
-            temp_bytes = flattened_doc.write()
-            flattened_doc.close()
+            page = pdf_doc[page_num]
+            page_rect = page.rect  # Each access builds a new Rect from the page's mediabox
             
-            # Update the original document reference
-            self.pdf_doc = fitz.open("pdf", temp_bytes)
-                
-            print("PDF flattened successfully")
+            # Create new page in flattened document
+            new_page = flattened_doc.new_page(width=page_rect.width, height=page_rect.height)
             
-        except Exception as e:
-            print(f"Error flattening PDF: {e}")
+            if page_images is not None:
+                image = page_images[page_num]
+            else:
+                image = _render_page_image(page, zoom, self.image_format, self.jpg_quality)
+            
+            # Insert the encoded image; JPEG bytes are embedded verbatim as DCTDecode
+            new_page.insert_image(page_rect, stream=image)
+            page_num += 1
+        
+        # Hand the flattened document over directly and close the original
+        self.pdf_doc = flattened_doc
+        pdf_doc.close()
+    
+    def _render_pages_parallel(self, pdf_doc: fitz.Document, page_numbers: List[int],
+                               zoom: float, workers: int) -> Dict[int, bytes]:
+        """
+        Render the given pages to encoded images in worker processes.
+        
+        Each worker opens its own copy of the document and renders one contiguous
+        slice of the page list, so the document is only parsed once per worker.
+        
+        Args:
+            pdf_doc: PyMuPDF document object
+            page_numbers: Pages to render, in ascending order
+            zoom: Zoom factor for rendering
+            workers: Number of worker processes
+            
+        Returns:
+            Encoded image bytes keyed by page number
+        """
+        pdf_bytes = pdf_doc.tobytes()
+        chunk_size = -(-len(page_numbers) // workers)  # Ceiling division
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_pages, pdf_bytes, page_numbers[start:start + chunk_size],
+                                zoom, self.image_format, self.jpg_quality)
+                for start in range(0, len(page_numbers), chunk_size)
+            ]
+            images = [image for future in futures for image in future.result()]
+        return dict(zip(page_numbers, images))
     
     def process_pdf(self, output_path: str = "signed_output.pdf") -> bool:
         """
@@ -667,22 +885,36 @@ class AutoPDFSigner:
         Returns:
             True if processing was successful, False otherwise
         """
+        incremental = (self.incremental and not self.rasterize
+                       and os.path.abspath(output_path) != os.path.abspath(self.input_pdf))
+        copied = False  # output_path holds our unsigned working copy until the save succeeds
         try:
             # Load entity data
-            print("Loading entity data...")
+            log.info("Loading entity data...")
             self.load_entity_data()
-            print(f"Loaded entity data: {self.entity_data}")
+            log.debug("Loaded entity data: %s", self.entity_data)
             
             # Open PDF document
-            print("Opening PDF document...")
-            self.pdf_doc = fitz.open(self.input_pdf)
+            log.info("Opening PDF document...")
+            if incremental:
+                # Work on a copy of the input so saving only appends the changed objects
+                shutil.copyfile(self.input_pdf, output_path)
+                copied = True
+                self.pdf_doc = fitz.open(output_path)
+                if not self.pdf_doc.can_save_incrementally():
+                    # e.g. the file needed repairing on open; fall back to a full rewrite
+                    self.pdf_doc.close()
+                    incremental = False
+            if not incremental:
+                self.pdf_doc = fitz.open(self.input_pdf)
+            self._drawn_pages.clear()
             
             # Try to fill form fields
-            print("Checking for form fields...")
+            log.info("Checking for form fields...")
             form_fields_filled = self.fill_form_fields(self.pdf_doc)
             
             # Try to place signature in signature fields
-            print("Checking for signature fields...")
+            log.info("Checking for signature fields...")
             signature_fields_filled = self.place_signature(self.pdf_doc)
             
             # If no form fields or signature fields were found, use fallback
@@ -690,26 +922,193 @@ class AutoPDFSigner:
                 self.fallback_placement(self.pdf_doc)
             
             # Flatten the PDF
-            print("Flattening PDF...")
+            log.info("Flattening PDF...")
             self.flatten_pdf(self.pdf_doc)
             
             # Save the result
-            print(f"Saving signed PDF to {output_path}...")
-            self.pdf_doc.save(output_path)
+            log.info("Saving signed PDF to %s...", output_path)
+            if incremental:
+                self.pdf_doc.save(output_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            else:
+                if self.subset_fonts:
+                    # The flattened text is final, so embedded fonts only need the glyphs it uses
+                    try:
+                        self.pdf_doc.subset_fonts()
+                    except Exception as e:
+                        log.warning("Could not subset fonts, embedding them in full: %s", e)
+                self.pdf_doc.save(output_path, **self.save_options)
+            copied = False
             self.pdf_doc.close()
             
-            print(f"Successfully created signed PDF: {output_path}")
+            log.info("Successfully created signed PDF: %s", output_path)
             return True
             
         except Exception as e:
-            print(f"Error processing PDF: {e}")
-            if self.pdf_doc:
+            log.error("Error processing PDF: %s", e)
+            if self.pdf_doc and not self.pdf_doc.is_closed:
                 self.pdf_doc.close()
+            if copied and os.path.exists(output_path):
+                # Don't leave the unsigned working copy behind as the output
+                os.remove(output_path)
             return False
+    
+    @classmethod
+    def sign_batch(cls, pdfs: List[str], entity_file: str, signature_image: str,
+                   output_dir: str = ".", **signer_options: Any) -> Dict[str, bool]:
+        """
+        Sign several PDFs in parallel worker processes.
+        
+        Args:
+            pdfs: Paths of the PDFs to sign
+            entity_file: Path to the entity data file shared by all PDFs
+            signature_image: Path to the signature image shared by all PDFs
+            output_dir: Directory for the signed PDFs, each named signed_<input name>;
+                inputs sharing a name get signed_<stem>_2.pdf, signed_<stem>_3.pdf, ...
+            **signer_options: Extra keyword arguments for each AutoPDFSigner
+            
+        Returns:
+            Dictionary mapping each input PDF to whether it was signed successfully
+        """
+        results = {}
+        pdfs = list(dict.fromkeys(pdfs))  # A PDF listed twice is only signed once
+        if not pdfs:
+            return results
+        
+        # Each PDF already gets its own process, so don't fan out again per page
+        signer_options.setdefault('render_workers', 1)
+        
+        output_paths = _batch_output_paths(pdfs, output_dir)
+        max_workers = min(os.cpu_count() or 1, 8, len(pdfs))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for pdf in pdfs:
+                output_path = output_paths[pdf]
+                futures[executor.submit(_sign_one, cls, pdf, entity_file, signature_image,
+                                        output_path, signer_options)] = pdf
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                pdf = futures[future]
+                try:
+                    results[pdf] = future.result()
+                except Exception as e:
+                    log.error("Error signing %s: %s", pdf, e)
+                    results[pdf] = False
+                log.info("[%d/%d] %s %s", done, len(pdfs), "Signed" if results[pdf] else "Failed", pdf)
+        
+        return results
+
+
+def _batch_output_paths(pdfs: List[str], output_dir: str) -> Dict[str, str]:
+    """
+    Choose an output path for each PDF of a batch so no two workers write the same file.
+    
+    Args:
+        pdfs: Paths of the PDFs to sign, without duplicates
+        output_dir: Directory for the signed PDFs
+        
+    Returns:
+        Dictionary mapping each input PDF to its output path
+    """
+    # Never write over one of the inputs either, e.g. when both x.pdf and signed_x.pdf are given
+    taken = {os.path.normcase(os.path.abspath(pdf)) for pdf in pdfs}
+    output_paths = {}
+    
+    for pdf in pdfs:
+        name = Path(pdf)
+        output_path = Path(output_dir) / f"signed_{name.name}"
+        index = 1
+        while os.path.normcase(os.path.abspath(output_path)) in taken:
+            index += 1
+            output_path = Path(output_dir) / f"signed_{name.stem}_{index}{name.suffix}"
+        if index > 1:
+            log.info("Saving %s as %s so it does not overwrite another file of the batch", pdf, output_path)
+        
+        taken.add(os.path.normcase(os.path.abspath(output_path)))
+        output_paths[pdf] = str(output_path)
+    
+    return output_paths
+
+
+def _sign_one(signer_class: type, input_pdf: str, entity_file: str, signature_image: str,
+              output_path: str, signer_options: Dict[str, Any]) -> bool:
+    """Sign a single PDF; module-level so worker processes can unpickle it."""
+    signer = signer_class(input_pdf, entity_file, signature_image, **signer_options)
+    return signer.process_pdf(output_path)
+
+
+def _render_page_image(page: fitz.Page, zoom: float, image_format: str, jpg_quality: int) -> bytes:
+    """Render a page at the given zoom factor and encode it as PNG or JPEG bytes."""
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    if _is_grayscale(pix):
+        # Text-only pages render with R == G == B; one channel is a third of the size
+        pix = fitz.Pixmap(fitz.csGRAY, pix)
+    return pix.tobytes(image_format, jpg_quality=jpg_quality)
+
+
+def _is_grayscale(pix: fitz.Pixmap) -> bool:
+    """Check whether every pixel of an RGB pixmap has equal red, green and blue values."""
+    if pix.n != 3:
+        return False
+    samples = pix.samples
+    # Strided slices compare all pixels at C speed, so a thin colored stroke is never missed
+    return samples[0::3] == samples[1::3] == samples[2::3]
+
+
+def _render_pages(pdf_bytes: bytes, page_numbers: List[int], zoom: float,
+                  image_format: str, jpg_quality: int) -> List[bytes]:
+    """Render the given pages to encoded images; module-level so worker processes can unpickle it."""
+    with fitz.open("pdf", pdf_bytes) as doc:
+        return [_render_page_image(doc[page_num], zoom, image_format, jpg_quality)
+                for page_num in page_numbers]
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _jpg_quality(value: str) -> int:
+    """Argparse type for a JPEG quality between 1 and 100."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if not 1 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 100, got {value}")
+    return number
 
 
 def main():
     """Main function to run the PDF signer."""
+    parser = argparse.ArgumentParser(description="Automatically sign PDF documents.")
+    parser.add_argument("pdfs", nargs="*",
+                        help="PDFs to sign in batch mode, each saved as signed_<name> (default: input.pdf)")
+    parser.add_argument("--rasterize", action="store_true",
+                        help="flatten by replacing the signed pages with images instead of baking fields")
+    parser.add_argument("--dpi", type=_positive_int, default=150,
+                        help="resolution of the page images with --rasterize (default: 150)")
+    parser.add_argument("--image-format", choices=("png", "jpeg"), default="png",
+                        help="encoding of the page images with --rasterize (default: png)")
+    parser.add_argument("--jpg-quality", type=_jpg_quality, default=85,
+                        help="JPEG quality with --image-format jpeg (default: 85)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="append the changes to a copy of the input instead of rewriting it "
+                             "(faster for large PDFs; ignored with --rasterize)")
+    parser.add_argument("--subset-fonts", action="store_true",
+                        help="keep only the used glyphs of embedded fonts (ignored with --incremental)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="also log matching details while filling fields")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(message)s", stream=sys.stdout)
+    
     # File paths
     input_pdf = "input.pdf"
     entity_file = "entity.txt"
@@ -717,7 +1116,7 @@ def main():
     output_pdf = "signed_output.pdf"
     
     # Check if all required files exist
-    required_files = [input_pdf, entity_file, signature_image]
+    required_files = (args.pdfs or [input_pdf]) + [entity_file, signature_image]
     missing_files = [f for f in required_files if not os.path.exists(f)]
     
     if missing_files:
@@ -726,9 +1125,23 @@ def main():
             print(f"  - {file}")
         sys.exit(1)
     
-    # Create signer instance and process
-    signer = AutoPDFSigner(input_pdf, entity_file, signature_image)
-    success = signer.process_pdf(output_pdf)
+    signer_options = {
+        'rasterize': args.rasterize,
+        'dpi': args.dpi,
+        'image_format': args.image_format,
+        'jpg_quality': args.jpg_quality,
+        'incremental': args.incremental,
+        'subset_fonts': args.subset_fonts,
+    }
+    
+    if args.pdfs:
+        # Batch mode: sign every given PDF in parallel
+        results = AutoPDFSigner.sign_batch(args.pdfs, entity_file, signature_image, **signer_options)
+        success = all(results.values())
+    else:
+        # Create signer instance and process
+        signer = AutoPDFSigner(input_pdf, entity_file, signature_image, **signer_options)
+        success = signer.process_pdf(output_pdf)
     
     if success:
         print("\n✅ PDF signing completed successfully!")